@@ -6,10 +6,16 @@ Designed for Raspberry Pi with 5 buttons connected to GPIO pins.
 
 Required libraries:
 - RPi.GPIO (for Raspberry Pi GPIO control)
-- pygame (for sound playback)
+- sounddevice (PortAudio output stream for sound playback)
+- soundfile (libsndfile decoding of the sound files)
+- numpy (sample buffers and mixing)
+
+Optional libraries:
+- gpiod (python3-libgpiod v1.x bindings, edge events when RPi.GPIO edge
+  detection fails; the v2 API is not supported)
 
 Install with:
-pip install RPi.GPIO pygame
+pip install RPi.GPIO sounddevice soundfile numpy
 
 Hardware Setup:
 - Connect 5 push buttons between GPIO pins and GND
@@ -18,200 +24,543 @@ Hardware Setup:
 """
 
 import RPi.GPIO as GPIO
-import pygame
+import numpy as np
+import sounddevice as sd
+import soundfile as sf
 import time
 import os
 import sys
-from threading import Thread
+import signal
+import mmap
+import select
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import ctypes
+import ctypes.util
+from collections import deque
+from threading import Thread, Event, Lock
+
+try:
+    import gpiod  # Optional: kernel edge events via the GPIO character device
+except ImportError:
+    gpiod = None
+
+# Log records are queued here and written out by a listener thread,
+# so button handlers never block on stdout
+log = logging.getLogger('gpio_sound_player')
+log.setLevel(logging.INFO)
+log.propagate = False
+_log_queue = queue.Queue(-1)
+log.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+
+# Output stream format - every track is converted to this once at load time
+SAMPLE_RATE = 22050
+OUTPUT_CHANNELS = 2
+BLOCK_FRAMES = 256  # ~11.6 ms per callback at 22050 Hz
+
+CLOCK_MONOTONIC = 1
+
+# A polled press must still read LOW this long after the falling edge
+SETTLE_NS = 5_000_000
+
+# BCM2835-BCM2711 GPIO level register for pins 0-31, relative to /dev/gpiomem
+GPLEV0_OFFSET = 0x34
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+
+class _Itimerspec(ctypes.Structure):
+    _fields_ = [('it_interval', _Timespec), ('it_value', _Timespec)]
+
+
+def open_tick_timer(interval_ns):
+    """Create a periodic timerfd; each os.read(fd, 8) blocks until the next tick.
+    
+    Returns None where timerfd is unavailable so callers can fall back to sleep.
+    """
+    if hasattr(os, 'timerfd_create'):  # Python 3.13+
+        fd = os.timerfd_create(time.CLOCK_MONOTONIC)
+        os.timerfd_settime_ns(fd, initial=interval_ns, interval=interval_ns)
+        return fd
+    
+    libc_name = ctypes.util.find_library('c')
+    if libc_name is None:
+        return None
+    libc = ctypes.CDLL(libc_name, use_errno=True)
+    if not hasattr(libc, 'timerfd_create'):
+        return None
+    
+    fd = libc.timerfd_create(CLOCK_MONOTONIC, 0)
+    if fd < 0:
+        return None
+    tick = _Timespec(interval_ns // 1_000_000_000, interval_ns % 1_000_000_000)
+    spec = _Itimerspec(it_interval=tick, it_value=tick)
+    if libc.timerfd_settime(fd, 0, ctypes.byref(spec), None) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+def to_stream_format(data, rate):
+    """Convert decoded int16 frames to SAMPLE_RATE stereo int16"""
+    if data.shape[1] == 1:
+        data = np.repeat(data, OUTPUT_CHANNELS, axis=1)
+    elif data.shape[1] > OUTPUT_CHANNELS:
+        data = data[:, :OUTPUT_CHANNELS]
+    
+    if rate != SAMPLE_RATE and len(data):
+        # Linear resample once here so playback never converts
+        frames = int(round(len(data) * SAMPLE_RATE / rate))
+        src = np.arange(len(data))
+        dst = np.linspace(0, len(data) - 1, frames)
+        data = np.stack([np.interp(dst, src, data[:, ch]) for ch in range(OUTPUT_CHANNELS)], axis=1)
+    
+    return np.ascontiguousarray(data, dtype=np.int16)
+
 
 class SoundPlayer:
     def __init__(self):
-        # GPIO pin configuration for buttons (BCM numbering)
-        self.button_pins = [18, 19, 20, 21, 26]  # GPIO pins for 5 buttons
-        
-        # Sound file paths - place your sound files in a 'sounds' directory
-        self.sound_files = [
-            'sounds/sound1.wav',
-            'sounds/sound2.wav', 
-            'sounds/sound3.wav',
-            'sounds/sound4.wav',
-            'sounds/sound5.wav'
-        ]
-        
-        # Track-specific playback configuration
-        self.track_config = {
-            0: {'mode': 'interrupt', 'self': 'ignore', 'priority': 3},    # Button 1
-            1: {'mode': 'interrupt', 'self': 'ignore', 'priority': 1},       # Button 2
-            2: {'mode': 'overlay', 'self': 'restart', 'priority': 2},    # Button 3
-            3: {'mode': 'overlay', 'self': 'queue', 'priority': 1},        # Button 4
-            4: {'mode': 'exclusive', 'self': 'ignore', 'priority': 5}      # Button 5
-        }
-        
-        # Initialize pygame mixer for sound playback
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-        
-        # Setup GPIO
-        self.setup_gpio()
-        
-        # Load sound files
-        self.load_sounds()
-        
-        # Track button states to prevent multiple triggers
-        self.button_states = [True] * 5  # True = not pressed (pull-up)
-        
-        # Track currently playing sounds
-        self.currently_playing = {}  # {button_index: pygame.mixer.Channel}
-        self.sound_channels = []     # List to store pygame channels
-        
-        print("GPIO Sound Player initialized!")
-        print("Button GPIO pins:", self.button_pins)
-        print("Track configurations loaded")
-        print("Press Ctrl+C to exit")
+        _log_listener.start()
+        try:
+            # GPIO pin configuration for buttons (BCM numbering)
+            self.button_pins = [18, 19, 20, 21, 26]  # GPIO pins for 5 buttons
+            
+            # Sound file paths - place your sound files in a 'sounds' directory
+            self.sound_files = [
+                'sounds/sound1.wav',
+                'sounds/sound2.wav', 
+                'sounds/sound3.wav',
+                'sounds/sound4.wav',
+                'sounds/sound5.wav'
+            ]
+            
+            # Track-specific playback configuration
+            self.track_config = {
+                0: {'mode': 'interrupt', 'self': 'ignore', 'priority': 3},    # Button 1
+                1: {'mode': 'interrupt', 'self': 'ignore', 'priority': 1},       # Button 2
+                2: {'mode': 'overlay', 'self': 'restart', 'priority': 2},    # Button 3
+                3: {'mode': 'overlay', 'self': 'queue', 'priority': 1},        # Button 4
+                4: {'mode': 'exclusive', 'self': 'ignore', 'priority': 5}      # Button 5
+            }
+            
+            # Flatten track_config into (mode, self, priority) tuples indexed by button
+            default_config = {'mode': 'overlay', 'self': 'restart', 'priority': 1}
+            self._cfg = []
+            for i in range(len(self.button_pins)):
+                config = self.track_config.get(i, default_config)
+                self._cfg.append((config.get('mode', 'overlay'),
+                                  config.get('self', 'restart'),
+                                  config.get('priority', 1)))
+            
+            # _lower[p] = bitmask of buttons whose priority is below p
+            max_priority = max(cfg[2] for cfg in self._cfg)
+            self._lower = [sum(1 << i for i, cfg in enumerate(self._cfg) if cfg[2] < p)
+                           for p in range(max_priority + 1)]
+            
+            # Edge detection is preferred; polling is only a fallback
+            self.chip = None
+            self.lines = None
+            self._epoll = None
+            self._gpiomem = None
+            self._gplev0 = None
+            self._input_loop = None  # Background loop feeding _on_press, if any
+            self._input_thread = None
+            self._stop = Event()
+            self._last_ns = [0] * len(self.button_pins)  # Last accepted press per button
+            self._wake_r, self._wake_w = os.pipe()  # Interrupts the epoll wait on shutdown
+            
+            # Load sound files
+            self.load_sounds()
+            
+            # Track currently playing sounds - a play cursor per button, None = idle
+            self._pos = [None] * len(self.button_pins)
+            self._pos_lock = Lock()  # Shared with the audio callback thread
+            self._active_mask = 0  # Bit i set while button i's track is playing
+            
+            # Mix every track ourselves in a PortAudio callback; 'low' asks the
+            # device for its low-latency buffering instead of the 'high' default
+            self._mix = np.zeros((BLOCK_FRAMES, OUTPUT_CHANNELS), dtype=np.int32)
+            self._stream = sd.OutputStream(samplerate=SAMPLE_RATE, channels=OUTPUT_CHANNELS,
+                                           dtype='int16', blocksize=BLOCK_FRAMES,
+                                           latency='low', callback=self._mix_callback)
+            self._stream.start()
+            
+            # Setup GPIO last - edge callbacks may fire as soon as it returns
+            self.setup_gpio()
+            
+            log.info("GPIO Sound Player initialized!")
+            log.info(f"Button GPIO pins: {self.button_pins}")
+            log.info("Track configurations loaded")
+            log.info("Press Ctrl+C to exit")
+        except BaseException:
+            # Flush queued diagnostics (e.g. missing sound files) before main()
+            # prints the error - cleanup() never runs for a half-built player
+            _log_listener.stop()
+            raise
     
     def setup_gpio(self):
         """Configure GPIO pins for button input"""
         GPIO.setmode(GPIO.BCM)  # Use BCM pin numbering
         
+        # Configure every pin first - the fallbacks rely on these pull-ups too
         for pin in self.button_pins:
             # Setup as input with internal pull-up resistor
             GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            print(f"Configured GPIO {pin} as input with pull-up")
+            log.info(f"Configured GPIO {pin} as input with pull-up")
+        
+        edges_ok = True
+        for i, pin in enumerate(self.button_pins):
+            # Button press = falling edge; the kernel wakes us only on real edges
+            # and RPi.GPIO drops switch bounce within the bouncetime window
+            bouncetime = self.get_bouncetime(i)
+            try:
+                GPIO.add_event_detect(pin, GPIO.FALLING,
+                                      callback=lambda channel, idx=i: self._on_press(idx),
+                                      bouncetime=bouncetime)
+            except RuntimeError as e:
+                # Newer kernels can refuse RPi.GPIO edge detection
+                log.warning(f"Edge detection unavailable on GPIO {pin}: {e}")
+                edges_ok = False
+                break
+            log.info(f"Edge detection on GPIO {pin} ({bouncetime} ms debounce)")
+        
+        if not edges_ok:
+            for pin in self.button_pins:
+                GPIO.remove_event_detect(pin)
+            if not self.setup_gpiod_events():
+                self.setup_polling()
+    
+    def setup_gpiod_events(self):
+        """Request falling-edge events from the GPIO character device"""
+        if gpiod is None:
+            return False
+        if not hasattr(gpiod, 'LINE_REQ_EV_FALLING_EDGE'):
+            # libgpiod v2 (request_lines/LineSettings) has a different API
+            log.warning("gpiod edge events need the libgpiod v1 Python bindings; "
+                        f"found gpiod {getattr(gpiod, '__version__', 'v2')}")
+            return False
+        try:
+            self.chip = gpiod.Chip('gpiochip0')
+            self.lines = self.chip.get_lines(self.button_pins)
+            self.lines.request(consumer='soundplayer',
+                               type=gpiod.LINE_REQ_EV_FALLING_EDGE,
+                               flags=gpiod.LINE_REQ_FLAG_BIAS_PULL_UP)
+        except OSError as e:
+            log.warning(f"gpiod edge events unavailable ({e})")
+            if self.chip is not None:
+                self.chip.close()
+            self.chip = None
+            self.lines = None
+            return False
+        
+        # One epoll set over every line's event fd, plus the shutdown pipe
+        self._epoll = select.epoll()
+        self._epoll.register(self._wake_r, select.EPOLLIN)
+        self._fd_to_idx = {}
+        for i, line in enumerate(self.lines.to_list()):
+            fd = line.event_get_fd()
+            self._epoll.register(fd, select.EPOLLIN)
+            self._fd_to_idx[fd] = i
+        
+        self._input_loop = self._event_loop
+        log.info("Waiting for button edges via gpiod + epoll")
+        return True
+    
+    def setup_polling(self):
+        """Fall back to polling all button pins every tick"""
+        self._input_loop = self._poll_loop
+        # Track button states to detect presses between ticks
+        self.button_states = [True] * len(self.button_pins)  # True = not pressed (pull-up)
+        self._pending = deque()  # (recheck_deadline_ns, button_index, edge_ns)
+        
+        if os.path.exists('/dev/gpiomem') and max(self.button_pins) < 32:
+            try:
+                fd = os.open('/dev/gpiomem', os.O_RDWR | os.O_SYNC)
+                try:
+                    self._gpiomem = mmap.mmap(fd, 4096, offset=0)
+                finally:
+                    os.close(fd)
+                self._gplev0 = memoryview(self._gpiomem)[GPLEV0_OFFSET:GPLEV0_OFFSET + 4]
+                log.info("Polling buttons via /dev/gpiomem level register")
+                return
+            except OSError as e:
+                log.warning(f"/dev/gpiomem unavailable ({e})")
+        
+        log.info("Polling buttons with GPIO.input")
+    
+    def read_buttons(self):
+        """Return the current level of every button pin"""
+        if self._gplev0 is not None:
+            # One memory load covers all pins - no syscalls
+            levels = int.from_bytes(self._gplev0, 'little')
+            return [(levels >> pin) & 1 for pin in self.button_pins]
+        return [GPIO.input(pin) for pin in self.button_pins]
+    
+    def get_bouncetime(self, button_index):
+        """Debounce window in ms - interrupt/exclusive tracks never re-fire quickly anyway"""
+        mode = self._cfg[button_index][0]
+        return 50 if mode in ('interrupt', 'exclusive') else 20
     
     def load_sounds(self):
         """Load sound files and verify they exist"""
-        self.sounds = []
+        self._pcm = []  # Stream-format int16 frames per track, None if missing
         
         # Create sounds directory if it doesn't exist
         if not os.path.exists('sounds'):
             os.makedirs('sounds')
-            print("Created 'sounds' directory. Please add your sound files:")
+            log.info("Created 'sounds' directory. Please add your sound files:")
             for i, sound_file in enumerate(self.sound_files):
-                print(f"  {i+1}. {sound_file}")
+                log.info(f"  {i+1}. {sound_file}")
+        
+        # List each sound directory once instead of stat()ing every file
+        present = {}
+        for sound_file in self.sound_files:
+            directory = os.path.dirname(sound_file) or '.'
+            if directory not in present:
+                try:
+                    with os.scandir(directory) as entries:
+                        present[directory] = {entry.name for entry in entries}
+                except OSError:
+                    present[directory] = set()
         
         for i, sound_file in enumerate(self.sound_files):
-            if os.path.exists(sound_file):
+            directory = os.path.dirname(sound_file) or '.'
+            if os.path.basename(sound_file) in present[directory]:
                 try:
-                    sound = pygame.mixer.Sound(sound_file)
-                    self.sounds.append(sound)
-                    print(f"Loaded: {sound_file}")
-                except pygame.error as e:
-                    print(f"Error loading {sound_file}: {e}")
-                    self.sounds.append(None)
+                    # Decode from the handle we opened - no second lookup by path
+                    with open(sound_file, 'rb') as f:
+                        data, rate = sf.read(f, dtype='int16', always_2d=True)
+                    self._pcm.append(to_stream_format(data, rate))
+                    log.info(f"Loaded: {sound_file}")
+                except (RuntimeError, OSError) as e:
+                    log.error(f"Error loading {sound_file}: {e}")
+                    self._pcm.append(None)
             else:
-                print(f"Warning: {sound_file} not found")
-                self.sounds.append(None)
+                log.warning(f"Warning: {sound_file} not found")
+                self._pcm.append(None)
+    
+    def _mix_callback(self, outdata, frames, time_info, status):
+        """PortAudio callback - sum every playing track into the output block"""
+        # Reuse one buffer - no allocation on the audio thread
+        if self._mix.shape[0] != frames:
+            self._mix = np.zeros((frames, OUTPUT_CHANNELS), dtype=np.int32)
+        mix = self._mix
+        mix.fill(0)
+        with self._pos_lock:
+            for i, pos in enumerate(self._pos):
+                if pos is None:
+                    continue
+                pcm = self._pcm[i]
+                n = min(frames, len(pcm) - pos)
+                mix[:n] += pcm[pos:pos + n]
+                if pos + n < len(pcm):
+                    self._pos[i] = pos + n
+                else:
+                    # Track finished - clear its bit here instead of polling later
+                    self._pos[i] = None
+                    self._active_mask &= ~(1 << i)
+        np.clip(mix, -32768, 32767, out=mix)
+        outdata[:] = mix
+    
+    def _start_track(self, button_index):
+        """Start (or restart) a track from its first frame"""
+        with self._pos_lock:
+            self._pos[button_index] = 0
+            self._active_mask |= 1 << button_index
+    
+    def _stop_track(self, button_index):
+        """Stop a single track"""
+        with self._pos_lock:
+            self._pos[button_index] = None
+            self._active_mask &= ~(1 << button_index)
     
     def stop_all_sounds(self):
         """Stop all currently playing sounds"""
-        pygame.mixer.stop()
-        self.currently_playing.clear()
-        print("Stopped all sounds")
+        with self._pos_lock:
+            self._pos[:] = [None] * len(self._pos)
+            self._active_mask = 0
+        log.info("Stopped all sounds")
     
     def stop_lower_priority_sounds(self, priority):
         """Stop sounds with lower priority than the given priority"""
-        to_remove = []
-        for btn_idx, channel in self.currently_playing.items():
-            if channel.get_busy():  # Still playing
-                btn_priority = self.track_config[btn_idx].get('priority', 1)
-                if btn_priority < priority:
-                    channel.stop()
-                    to_remove.append(btn_idx)
-        
-        for btn_idx in to_remove:
-            del self.currently_playing[btn_idx]
-            print(f"Stopped lower priority sound {btn_idx + 1}")
+        to_stop = self._active_mask & self._lower[priority]
+        while to_stop:
+            btn_idx = (to_stop & -to_stop).bit_length() - 1  # Lowest set bit
+            self._stop_track(btn_idx)
+            log.info(f"Stopped lower priority sound {btn_idx + 1}")
+            to_stop &= to_stop - 1
     
     def is_anything_playing(self):
         """Check if any sounds are currently playing"""
-        # Clean up finished sounds
-        to_remove = []
-        for btn_idx, channel in self.currently_playing.items():
-            if not channel.get_busy():
-                to_remove.append(btn_idx)
-        
-        for btn_idx in to_remove:
-            del self.currently_playing[btn_idx]
-        
-        return len(self.currently_playing) > 0
+        return self._active_mask != 0
     
     def play_sound(self, button_index):
         """Play sound for the specified button with configuration rules"""
-        if button_index >= len(self.sounds) or not self.sounds[button_index]:
-            print(f"No sound available for button {button_index + 1}")
+        if button_index >= len(self._pcm) or self._pcm[button_index] is None:
+            log.warning(f"No sound available for button {button_index + 1}")
             return
         
-        config = self.track_config.get(button_index, {'mode': 'overlay', 'self': 'restart', 'priority': 1})
-        mode = config.get('mode', 'overlay')
-        self_behavior = config.get('self', 'restart')
-        priority = config.get('priority', 1)
+        mode, self_behavior, priority = self._cfg[button_index]
         
-        print(f"Button {button_index + 1} pressed - Mode: {mode}, Priority: {priority}")
+        log.info(f"Button {button_index + 1} pressed - Mode: {mode}, Priority: {priority}")
         
         # Check if this same button is already playing
-        if button_index in self.currently_playing:
-            channel = self.currently_playing[button_index]
-            if channel.get_busy():  # Still playing
-                if self_behavior == 'ignore':
-                    print(f"Button {button_index + 1} already playing, ignoring")
-                    return
-                elif self_behavior == 'restart':
-                    channel.stop()
-                    print(f"Restarting sound {button_index + 1}")
-                # queue behavior would be handled here (more complex)
+        if self._active_mask & (1 << button_index):
+            if self_behavior == 'ignore':
+                log.info(f"Button {button_index + 1} already playing, ignoring")
+                return
+            elif self_behavior == 'restart':
+                self._stop_track(button_index)
+                log.info(f"Restarting sound {button_index + 1}")
+            # 'queue' is not implemented yet. Each button has one play cursor
+            # (one dedicated channel), so a second press falls through and
+            # restarts the track - it no longer layers a second copy on top
         
         # Handle interaction with other sounds
         if mode == 'interrupt':
             self.stop_all_sounds()
-            print(f"Button {button_index + 1} interrupting all sounds")
+            log.info(f"Button {button_index + 1} interrupting all sounds")
         elif mode == 'exclusive':
             if self.is_anything_playing():
-                print(f"Button {button_index + 1} blocked - other sounds playing")
+                log.info(f"Button {button_index + 1} blocked - other sounds playing")
                 return
         elif mode == 'overlay':
             # Stop lower priority sounds only
             self.stop_lower_priority_sounds(priority)
         
-        # Play the sound
-        channel = self.sounds[button_index].play()
-        if channel:
-            self.currently_playing[button_index] = channel
-            print(f"Playing sound {button_index + 1}: {self.sound_files[button_index]}")
-        else:
-            print(f"Failed to play sound {button_index + 1} - no available channels")
+        # Play the sound from its first frame
+        self._start_track(button_index)
+        log.info(f"Playing sound {button_index + 1}: {self.sound_files[button_index]}")
+    
+    def _on_press(self, button_index):
+        """Press handler - runs on the RPi.GPIO event thread or the input thread"""
+        log.info(f"Button {button_index + 1} pressed (GPIO {self.button_pins[button_index]})")
+        try:
+            self.play_sound(button_index)
+        except Exception:
+            # Keep the calling thread alive for the next press
+            log.exception(f"Error playing sound {button_index + 1}")
+    
+    def _in_bounce_window(self, button_index, now_ns):
+        """True if now_ns is too soon after this button's last accepted press"""
+        return now_ns - self._last_ns[button_index] < self.get_bouncetime(button_index) * 1_000_000
     
     def check_buttons(self):
-        """Check button states and play sounds when pressed"""
-        for i, pin in enumerate(self.button_pins):
-            current_state = GPIO.input(pin)
-            
-            # Button pressed = LOW (False), Released = HIGH (True)
+        """Poll button states and play sounds once a press has settled"""
+        now = time.monotonic_ns()
+        levels = self.read_buttons()
+        
+        # Confirm presses whose settle time has passed - noise will have gone HIGH again
+        while self._pending and self._pending[0][0] <= now:
+            _, i, edge_ns = self._pending.popleft()
+            if not levels[i]:
+                self._last_ns[i] = edge_ns
+                self._on_press(i)
+        
+        for i, current_state in enumerate(levels):
+            # Button pressed = LOW (0), Released = HIGH (1)
             if not current_state and self.button_states[i]:
-                # Button just pressed (was released, now pressed)
-                print(f"Button {i + 1} pressed (GPIO {pin})")
-                self.play_sound(i)
+                # Button just pressed (was released, now pressed) - verify it later
+                if not self._in_bounce_window(i, now):
+                    self._pending.append((now + SETTLE_NS, i, now))
                 self.button_states[i] = False
             elif current_state and not self.button_states[i]:
                 # Button just released (was pressed, now released)
                 self.button_states[i] = True
     
-    def run(self):
-        """Main loop to monitor buttons"""
+    def _set_realtime_priority(self):
+        """Ask for SCHED_FIFO on the calling thread so button input preempts housekeeping"""
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+            log.info("Input thread running with SCHED_FIFO priority 20")
+        except (AttributeError, OSError) as e:
+            log.warning(f"Could not set real-time priority ({e}), running at normal priority")
+    
+    def _event_loop(self):
+        """Edge-event thread - blocks in epoll until a button line fires"""
+        self._set_realtime_priority()
+        lines = self.lines.to_list()
+        try:
+            while not self._stop.is_set():
+                for fd, _ in self._epoll.poll():
+                    if fd == self._wake_r:
+                        return
+                    i = self._fd_to_idx[fd]
+                    lines[i].event_read()
+                    now = time.monotonic_ns()
+                    # gpiod v1 has no debounce setting, so filter bounces by timestamp
+                    if self._in_bounce_window(i, now):
+                        continue  # Switch bounce
+                    self._last_ns[i] = now
+                    self._on_press(i)
+        except Exception:
+            log.exception("Button event thread stopped - buttons will not respond")
+    
+    def _poll_loop(self):
+        """Polling thread - samples every button pin each tick"""
+        self._set_realtime_priority()
+        
+        # Kernel-enforced 10 ms ticks - no sleep drift under load
+        timer_fd = open_tick_timer(10_000_000)
         try:
-            while True:
+            while not self._stop.is_set():
                 self.check_buttons()
-                time.sleep(0.01)  # Small delay to prevent excessive CPU usage
+                if timer_fd is not None:
+                    os.read(timer_fd, 8)  # Blocks until the next tick
+                else:
+                    time.sleep(0.01)  # Small delay to prevent excessive CPU usage
+        except Exception:
+            log.exception("Button polling thread stopped - buttons will not respond")
+        finally:
+            if timer_fd is not None:
+                os.close(timer_fd)
+    
+    def run(self):
+        """Wait for button presses until Ctrl+C"""
+        try:
+            if self._input_loop is not None:
+                self._input_thread = Thread(target=self._input_loop, daemon=True)
+                self._input_thread.start()
+            # Sleep in the kernel; button presses arrive via edge callbacks
+            # or the input thread
+            signal.pause()
                 
         except KeyboardInterrupt:
-            print("\nShutting down...")
+            log.info("\nShutting down...")
         finally:
             self.cleanup()
     
     def cleanup(self):
-        """Clean up GPIO and pygame resources"""
-        print("Cleaning up GPIO...")
-        GPIO.cleanup()
-        pygame.mixer.quit()
-        print("Cleanup complete")
+        """Clean up GPIO and audio resources"""
+        try:
+            log.info("Cleaning up GPIO...")
+            # Silence every press source before the log listener goes away
+            self._stop.set()
+            os.write(self._wake_w, b'\0')
+            if self._input_thread is not None:
+                self._input_thread.join(timeout=1)
+            GPIO.cleanup()  # Also removes RPi.GPIO edge detection
+            
+            if self._epoll is not None:
+                self._epoll.close()
+            if self._gplev0 is not None:
+                self._gplev0.release()
+                self._gpiomem.close()
+            if self.lines is not None:
+                self.lines.release()
+                self.chip.close()
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._stream.stop()
+            self._stream.close()
+            log.info("Cleanup complete")
+        finally:
+            # Flush queued log messages - nothing can log after this point
+            _log_listener.stop()
 
 def main():
     """Main function to run the sound player"""
@@ -227,7 +576,7 @@ def main():
         print("\nTroubleshooting:")
         print("1. Make sure you're running on a Raspberry Pi")
         print("2. Run with sudo if you get permission errors: sudo python3 gpio_sound_player.py")
-        print("3. Install required libraries: pip install RPi.GPIO pygame")
+        print("3. Install required libraries: pip install RPi.GPIO sounddevice soundfile numpy")
         print("4. Check GPIO connections and sound files")
 
 if __name__ == "__main__":
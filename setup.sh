@@ -34,15 +34,15 @@ if [[ $(uname -m) == "arm"* ]] || [[ $(uname -m) == "aarch64" ]]; then
     sudo apt update
     
     # Install system dependencies
-    sudo apt install -y python3-pygame python3-rpi.gpio python3-pip
+    sudo apt install -y python3-rpi.gpio python3-numpy python3-soundfile libportaudio2 python3-pip
     
     # Install via pip as backup
-    pip3 install --user pygame RPi.GPIO
+    pip3 install --user sounddevice soundfile numpy RPi.GPIO
     
     echo "Dependencies installed successfully!"
 else
     echo "Not running on Raspberry Pi - skipping GPIO library installation"
-    echo "On Raspberry Pi, run: sudo apt install python3-pygame python3-rpi.gpio"
+    echo "On Raspberry Pi, run: sudo apt install python3-rpi.gpio python3-numpy python3-soundfile libportaudio2"
 fi
 
 echo ""